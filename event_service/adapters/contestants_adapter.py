@@ -1,5 +1,7 @@
 """Module for contestant adapter."""
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
+
+from pymongo import UpdateOne
 
 from .adapter import Adapter
 
@@ -20,6 +22,19 @@ class ContestantsAdapter(Adapter):
             contestants.append(contestant)
         return contestants
 
+    @classmethod
+    async def get_contestants_by_ageclasses(
+        cls: Any, db: Any, event_id: str, ageclasses: List[str]
+    ) -> List:  # pragma: no cover
+        """Get all contestants in given ageclasses function."""
+        contestants: List = []
+        cursor = db.contestants_collection.find(
+            {"$and": [{"event_id": event_id}, {"ageclass": {"$in": ageclasses}}]}
+        ).sort([("id", 1)])
+        for contestant in await cursor.to_list(None):  # we ask for all contestants
+            contestants.append(contestant)
+        return contestants
+
     @classmethod
     async def create_contestant(
         cls: Any, db: Any, event_id: str, contestant: dict
@@ -28,6 +43,30 @@ class ContestantsAdapter(Adapter):
         result = await db.contestants_collection.insert_one(contestant)
         return result
 
+    @classmethod
+    async def upsert_contestants(
+        cls: Any, db: Any, event_id: str, contestants: List[dict], filters: List[dict]
+    ) -> dict:  # pragma: no cover
+        """Create or update many contestants function.
+
+        Returns the indexes of the created contestants, mapped to their _id.
+        Raises BulkWriteError if a write fails.
+        """
+        operations = [
+            UpdateOne(
+                {"$and": [{"event_id": event_id}, _filter]},
+                {
+                    "$set": {k: v for k, v in contestant.items() if k != "id"},
+                    "$setOnInsert": {"id": contestant["id"]},
+                },
+                upsert=True,
+            )
+            for contestant, _filter in zip(contestants, filters)
+        ]
+        # Ordered, so that a row matches a contestant upserted earlier in the batch:
+        result = await db.contestants_collection.bulk_write(operations, ordered=True)
+        return result.upserted_ids
+
     @classmethod
     async def get_contestant_by_id(
         cls: Any, db: Any, event_id: str, contestant_id: str
@@ -84,6 +123,21 @@ class ContestantsAdapter(Adapter):
         )
         return result
 
+    @classmethod
+    async def update_bibs(
+        cls: Any, db: Any, event_id: str, bibs: Dict[str, int]
+    ) -> None:  # pragma: no cover
+        """Update the bib of many contestants in one bulk write function."""
+        operations = [
+            UpdateOne(
+                {"$and": [{"event_id": event_id}, {"id": contestant_id}]},
+                {"$set": {"bib": bib}},
+            )
+            for contestant_id, bib in bibs.items()
+        ]
+        if operations:
+            await db.contestants_collection.bulk_write(operations, ordered=False)
+
     @classmethod
     async def delete_contestant(
         cls: Any, db: Any, event_id: str, contestant_id: str
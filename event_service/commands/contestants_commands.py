@@ -1,6 +1,6 @@
 """Module for contestants service."""
 from random import shuffle
-from typing import Any, List
+from typing import Any, Dict, List
 
 from event_service.services import (
     ContestantsService,
@@ -118,16 +118,11 @@ class ContestantsCommands:
             _list, key=lambda k: (k["raceclass_group"], k["raceclass_order"])
         )
         # For every contestant, assign unique bib
+        bibs: Dict[str, int] = {}
         bib_no = 0
         for d in _list_sorted_on_raceclass:
             bib_no += 1
-            d["bib"] = bib_no
-
-        # finally update contestant record:
-        for _c in contestants:
-            c_with_bib = next(
-                item for item in _list_sorted_on_raceclass if item["id"] == _c.id
-            )
-            _c.bib = c_with_bib["bib"]
-            assert _c.id is not None
-            await ContestantsService.update_contestant(db, event_id, _c.id, _c)
+            bibs[d["id"]] = bib_no
+
+        # finally update all contestant records in one go:
+        await ContestantsService.update_bibs(db, event_id, bibs)
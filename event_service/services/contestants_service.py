@@ -3,11 +3,12 @@ from datetime import datetime
 from io import StringIO
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 import numpy as np
 import pandas as pd
+from pymongo.errors import BulkWriteError
 
 from event_service.adapters import ContestantsAdapter, RaceclassesAdapter
 from event_service.models import Contestant
@@ -19,6 +20,9 @@ from .exceptions import (
 )
 
 
+CREATE_CONTESTANTS_BATCH_SIZE = 1000
+
+
 def create_id() -> str:  # pragma: no cover
     """Creates an uuid."""
     return str(uuid.uuid4())
@@ -82,11 +86,12 @@ class ContestantsService:
             raise RaceclassNotFoundException(f'Raceclass "{raceclass!r}" not found.')
 
         _raceclass: Dict = raceclasses[0]
-        # Then filter contestants on ageclasses:
-        _contestants = await ContestantsAdapter.get_all_contestants(db, event_id)
+        # Then get the contestants in the raceclass' ageclasses:
+        _contestants = await ContestantsAdapter.get_contestants_by_ageclasses(
+            db, event_id, _raceclass["ageclasses"]
+        )
         for _c in _contestants:
-            if _c["ageclass"] in _raceclass["ageclasses"]:
-                contestants.append(Contestant.from_dict(_c))
+            contestants.append(Contestant.from_dict(_c))
 
         # We sort the list on bib, ageclass, last- and first-name:
         _s = sorted(
@@ -109,10 +114,11 @@ class ContestantsService:
     ) -> List[Contestant]:
         """Get all contestants function filter by ageclass."""
         contestants = []
-        _contestants = await ContestantsAdapter.get_all_contestants(db, event_id)
+        _contestants = await ContestantsAdapter.get_contestants_by_ageclasses(
+            db, event_id, [ageclass]
+        )
         for _c in _contestants:
-            if _c["ageclass"] == ageclass:
-                contestants.append(Contestant.from_dict(_c))
+            contestants.append(Contestant.from_dict(_c))
         _s = sorted(
             contestants,
             key=lambda k: (
@@ -232,7 +238,6 @@ class ContestantsService:
 
         contestants = df.to_dict("records")
         # For every record, create contestant:
-        # TODO: consider parallellizing this
         # create id
         result: Dict[str, Any] = {
             "total": 0,
@@ -240,6 +245,10 @@ class ContestantsService:
             "updated": [],
             "failures": [],
         }
+        # Contestants are collected and created or updated in batches after the loop:
+        upserts: Dict[tuple, Tuple[dict, dict, int]] = {}
+        # The bibs of the pending contestants are not in the db yet:
+        pending_bibs: Dict[int, tuple] = {}
         for _c in contestants:
             result["total"] += 1
             _c["event_id"] = event_id  # type: ignore
@@ -263,42 +272,34 @@ class ContestantsService:
                 # Validate:
                 await _validate_contestant(db, event_id, contestant)
 
-                # insert new contestant
-                # Check if contestant exist. If so, update:
-                _existing_contestant = await _contestant_exist(db, event_id, contestant)
-                if _existing_contestant:
-                    updated_contestant = contestant.to_dict()
-                    _result = await ContestantsAdapter.update_contestant(
-                        db, event_id, _existing_contestant["id"], updated_contestant
-                    )
-                    logging.debug(
-                        f"updated event_id/contestant_id: {event_id}/{contestant_id}"
+                _filter = _contestant_filter(contestant)
+                key = tuple(_filter.items())
+                if contestant.bib and pending_bibs.get(contestant.bib, key) != key:
+                    raise BibAlreadyInUseException(
+                        f"Bib {contestant.bib} allready in use by another contestant."
                     )
-                    if _result:
-                        result["updated"].append(f"contestant: {contestant.to_dict()}")
-                    else:
-                        result["failures"].append(
-                            f"reason: {_result}: {contestant.to_dict()}"
-                        )
-                else:
-                    new_contestant = contestant.to_dict()
-                    _result = await ContestantsAdapter.create_contestant(
-                        db, event_id, new_contestant
-                    )
-                    logging.debug(
-                        f"inserted event_id/contestant_id: {event_id}/{contestant_id}"
-                    )
-                    if _result:
-                        result["created"] += 1
-                    else:
-                        result["failures"].append(
-                            f"reason: {_result}: {contestant.to_dict()}"
-                        )
-            except IllegalValueException as e:
+                # A repeated row replaces the pending document, and is reported
+                # together with it when the document is written:
+                repeats = 0
+                if key in upserts:
+                    _, _pending, repeats = upserts[key]
+                    pending_bibs.pop(_pending["bib"], None)
+                    repeats += 1
+                if contestant.bib:
+                    pending_bibs[contestant.bib] = key
+                upserts[key] = (_filter, contestant.to_dict(), repeats)
+            except (BibAlreadyInUseException, IllegalValueException) as e:
                 logging.error(f"Failed to create contestant with {_c}. {e}")
                 result["failures"].append(f"reason: {e}: {_c}")
                 continue
 
+        # Create or update contestants in batches:
+        _upserts = list(upserts.values())
+        for i in range(0, len(_upserts), CREATE_CONTESTANTS_BATCH_SIZE):
+            batch = _upserts[i : i + CREATE_CONTESTANTS_BATCH_SIZE]
+            await _upsert_contestants(db, event_id, batch, result)
+            logging.debug(f"upserted {len(batch)} contestants in event {event_id}")
+
         return result
 
     @classmethod
@@ -348,6 +349,19 @@ class ContestantsService:
             f"Contestant with id {contestant_id} not found."
         ) from None
 
+    @classmethod
+    async def update_bibs(
+        cls: Any, db: Any, event_id: str, bibs: Dict[str, int]
+    ) -> None:
+        """Update the bib of many contestants function.
+
+        Args:
+            db (Any): the db
+            event_id (str): identifier of the event the contestants take part in
+            bibs (Dict[str, int]): the new bib of each contestant, keyed on id
+        """
+        await ContestantsAdapter.update_bibs(db, event_id, bibs)
+
     @classmethod
     async def delete_contestant(
         cls: Any, db: Any, event_id: str, contestant_id: str
@@ -406,6 +420,7 @@ async def _parse_contestants_sportsadmin(contestants: str) -> pd.DataFrame:
         df = pd.read_csv(
             StringIO(contestants),
             sep=";",
+            engine="c",
             encoding="utf-8",
             dtype=str,
             skiprows=2,
@@ -456,6 +471,7 @@ async def _parse_contestants_i_sonen(contestants: str) -> pd.DataFrame:
         df = pd.read_csv(
             StringIO(contestants),
             sep=";",
+            engine="c",
             encoding="utf-8",
             dtype=str,
             header=0,
@@ -490,6 +506,77 @@ async def _parse_contestants_i_sonen(contestants: str) -> pd.DataFrame:
         ) from e
 
 
+async def _upsert_contestants(
+    db: Any,
+    event_id: str,
+    batch: List[Tuple[dict, dict, int]],
+    result: Dict[str, Any],
+) -> None:
+    """Create or update a batch of contestants and add the outcome to the report.
+
+    The bulk write is ordered and stops at the first row that fails. That row is
+    reported as a failure, and the rows after it are sent in a new bulk write.
+    Every batch item carries the number of repeated csv rows it replaced, and
+    these rows are reported as updated or failed together with the item.
+    """
+    start = 0
+    while start < len(batch):
+        pending = batch[start:]
+        failed: Dict[int, str] = {}
+        try:
+            created = await ContestantsAdapter.upsert_contestants(
+                db,
+                event_id,
+                [_contestant for _, _contestant, _ in pending],
+                [_filter for _filter, _, _ in pending],
+            )
+            written = len(pending)
+        except BulkWriteError as e:
+            if e.details["writeErrors"]:
+                created = {
+                    upserted["index"]: None for upserted in e.details["upserted"]
+                }
+                for error in e.details["writeErrors"]:
+                    failed[error["index"]] = error["errmsg"]
+                # The rows after the failing one were not written:
+                written = max(failed) + 1
+            else:
+                # Only the write concern failed, so no row is known to be stored:
+                reason = "; ".join(
+                    error["errmsg"] for error in e.details["writeConcernErrors"]
+                )
+                created = {}
+                failed = dict.fromkeys(range(len(pending)), reason or str(e))
+                written = len(pending)
+        for j, (_, _contestant, repeats) in enumerate(pending[:written]):
+            if j in failed:
+                logging.error(f"Failed to upsert contestant {_contestant}. {failed[j]}")
+                result["failures"].extend(
+                    [f"reason: {failed[j]}: {_contestant}"] * (1 + repeats)
+                )
+                continue
+            if j in created:
+                result["created"] += 1
+            updates = repeats if j in created else 1 + repeats
+            # The stored contestant keeps its id, so the new one is left out:
+            result["updated"].extend(
+                [f"contestant: {_without_id(_contestant)}"] * updates
+            )
+        start += written
+
+
+def _without_id(contestant: dict) -> dict:
+    """Return the contestant without its id."""
+    return {k: v for k, v in contestant.items() if k != "id"}
+
+
+def _contestant_filter(contestant: Contestant) -> dict:
+    """Return the fields used to identify a contestant, as in _contestant_exist."""
+    if contestant.minidrett_id:
+        return {"minidrett_id": contestant.minidrett_id}
+    return {"first_name": contestant.first_name, "last_name": contestant.last_name}
+
+
 async def _contestant_exist(
     db: Any, event_id: str, contestant: Contestant
 ) -> Optional[dict]:
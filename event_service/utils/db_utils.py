@@ -1,4 +1,5 @@
 """Drop db and recreate indexes."""
+import asyncio
 from typing import Any
 
 
@@ -10,6 +11,17 @@ async def drop_db_and_recreate_indexes(mongo: Any, db_name: str) -> None:
     await create_indexes(db)
 
 
+async def truncate_db(mongo: Any, db_name: str) -> None:
+    """Delete all documents in db, but keep collections and indexes."""
+    db = mongo[f"{db_name}"]
+    collection_names = await db.list_collection_names()
+    await asyncio.gather(
+        *(db[collection_name].delete_many({}) for collection_name in collection_names)
+    )
+    # Creating an existing index is a no-op, but restores dropped ones:
+    await create_indexes(db)
+
+
 async def drop_db(mongo: Any, db_name: str) -> None:
     """Drop db."""
     await mongo.drop_database(f"{db_name}")
@@ -23,6 +35,7 @@ async def create_indexes(db: Any) -> None:
     )
     await db.contestants_collection.create_index([("event_id", 1), ("bib", 1)])
     await db.contestants_collection.create_index([("event_id", 1), ("minidrett_id", 1)])
+    await db.contestants_collection.create_index([("event_id", 1), ("ageclass", 1)])
 
     # events_collection:
     await db.events_collection.create_index([("id", 1)], unique=True)
@@ -71,6 +71,7 @@ def unit_tests(session: Session) -> None:
     args = session.posargs
     session.install(".")
     session.install(
+        "orjson",
         "pytest",
         "pytest-mock",
         "pytest-aiohttp",
@@ -93,6 +94,7 @@ def integration_tests(session: Session) -> None:
     session.install(".")
     session.install(
         "coverage[toml]",
+        "orjson",
         "pytest",
         "pytest-cov",
         "pytest-mock",
@@ -119,9 +121,10 @@ def integration_tests(session: Session) -> None:
 @session(python=["3.11"])
 def contract_tests(session: Session) -> None:
     """Run the contract test suite."""
-    args = session.posargs
+    args = session.posargs or ["tests/contract"]
     session.install(".")
     session.install(
+        "orjson",
         "pytest",
         "pytest-docker",
         "pytest_mock",
@@ -2,11 +2,12 @@
 import os
 from os import environ as env
 import time
-from typing import Any
+from typing import Any, List
 
 from aiohttp.test_utils import TestClient as _TestClient
 from dotenv import load_dotenv
 import pytest
+from pytest_asyncio import is_async_test
 import requests  # type: ignore
 from requests.exceptions import ConnectionError  # type: ignore
 
@@ -16,6 +17,31 @@ load_dotenv()
 HOST_PORT = int(env.get("HOST_PORT", "8080"))
 
 
+def pytest_addoption(parser: Any) -> None:
+    """Add command line options."""
+    parser.addoption(
+        "--keepdb",
+        action="store_true",
+        default=False,
+        help="keep the contract test database after the test session",
+    )
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """Run the async tests on the session event loop, like the async fixtures.
+
+    Tests that ask for a loop of their own, with an explicit scope or
+    loop_scope on their asyncio marker, are left alone.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if not is_async_test(item):
+            continue
+        if any(marker.kwargs for marker in item.iter_markers("asyncio")):
+            continue
+        item.add_marker(session_loop, append=False)
+
+
 @pytest.mark.integration
 @pytest.fixture
 async def client(aiohttp_client: Any) -> _TestClient:
@@ -0,0 +1,262 @@
+"""Conftest module for contract tests."""
+import asyncio
+from dataclasses import dataclass
+from io import BytesIO
+import logging
+import os
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    DummyCookieJar,
+    FormData,
+    hdrs,
+    TCPConnector,
+)
+import motor.motor_asyncio
+import orjson
+import pytest
+import pytest_asyncio
+
+from event_service.utils import db_utils
+
+
+# No slots=True here: it needs python 3.10, and we still support 3.9.
+@dataclass(frozen=True)
+class ContractConfig:
+    """Settings for the contract tests, read once from the environment."""
+
+    users_host_server: Optional[str]
+    users_host_port: Optional[str]
+    db_host: str
+    db_port: int
+    db_name: str
+    db_user: Optional[str]
+    db_password: Optional[str]
+    admin_username: Optional[str]
+    admin_password: Optional[str]
+
+
+CONFIG = ContractConfig(
+    users_host_server=os.getenv("USERS_HOST_SERVER"),
+    users_host_port=os.getenv("USERS_HOST_PORT"),
+    db_host=os.getenv("DB_HOST", "localhost"),
+    db_port=int(os.getenv("DB_PORT", 27017)),
+    db_name=os.getenv("DB_NAME", "events_test"),
+    db_user=os.getenv("DB_USER"),
+    db_password=os.getenv("DB_PASSWORD"),
+    admin_username=os.getenv("ADMIN_USERNAME"),
+    admin_password=os.getenv("ADMIN_PASSWORD"),
+)
+
+JSON_HEADERS = {hdrs.CONTENT_TYPE: "application/json"}
+CONTRACT_TESTS_DIR = Path(__file__).parent
+TEST_FILES_DIR = CONTRACT_TESTS_DIR.parent / "files"
+
+
+@pytest.fixture(scope="session")
+def isonen_csv_bytes() -> bytes:
+    """Read the iSonen csv-file once."""
+    return (TEST_FILES_DIR / "contestants_iSonen.csv").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def sportsadmin_csv_bytes() -> bytes:
+    """Read the Sportsadmin csv-file once."""
+    return (TEST_FILES_DIR / "contestants_Sportsadmin.csv").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def sportsadmin_g11_csv_bytes() -> bytes:
+    """Read the Sportsadmin G11 csv-file once."""
+    return (TEST_FILES_DIR / "contestants_G11_Sportsadmin.csv").read_bytes()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_session() -> AsyncGenerator:
+    """Share one client session, and its connection pool, across the test session."""
+    connector = TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        ttl_dns_cache=300,
+        keepalive_timeout=120,
+        enable_cleanup_closed=True,
+    )
+    timeout = ClientTimeout(total=60, connect=10)
+    async with ClientSession(
+        connector=connector,
+        timeout=timeout,
+        cookie_jar=DummyCookieJar(),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+    ) as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session")
+async def token(http_service: Any, http_session: ClientSession) -> str:
+    """Create a valid token."""
+    url = f"http://{CONFIG.users_host_server}:{CONFIG.users_host_port}/login"
+    headers = JSON_HEADERS
+    request_body = {
+        "username": CONFIG.admin_username,
+        "password": CONFIG.admin_password,
+    }
+    async with http_session.post(url, headers=headers, json=request_body) as response:
+        response.raise_for_status()
+        body = await response.json(loads=orjson.loads)
+    return body["token"]
+
+
+@pytest.fixture(scope="session")
+def auth_headers(token: str) -> dict:
+    """Authorization header for the test session."""
+    return {hdrs.AUTHORIZATION: f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
+def auth_json_headers(auth_headers: dict) -> dict:
+    """Authorization and json content type headers for the test session."""
+    return {**JSON_HEADERS, **auth_headers}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def mongo() -> AsyncGenerator:
+    """Share one Mongo client, and its connection pool, across the test session."""
+    mongo = motor.motor_asyncio.AsyncIOMotorClient(  # type: ignore
+        host=CONFIG.db_host,
+        port=CONFIG.db_port,
+        username=CONFIG.db_user,
+        password=CONFIG.db_password,
+        maxPoolSize=50,
+        minPoolSize=5,
+    )
+    yield mongo
+    mongo.close()
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def init_db(mongo: Any, request: Any) -> AsyncGenerator:
+    """Drop db and recreate indexes once before and drop db after the test session.
+
+    The final drop is skipped when pytest is run with --keepdb.
+    """
+    try:
+        await db_utils.drop_db_and_recreate_indexes(mongo, CONFIG.db_name)
+    except Exception as error:
+        logging.error(f"Failed to drop database {CONFIG.db_name}: {error}")
+        raise error
+
+    yield
+
+    if request.config.getoption("--keepdb"):
+        return
+    try:
+        await db_utils.drop_db(mongo, CONFIG.db_name)
+    except Exception as error:
+        logging.error(f"Failed to drop database {CONFIG.db_name}: {error}")
+        raise error
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def clear_db(mongo: Any, init_db: None) -> None:
+    """Clear db before each test module, keeping collections and indexes."""
+    try:
+        await db_utils.truncate_db(mongo, CONFIG.db_name)
+    except Exception as error:
+        logging.error(f"Failed to truncate database {CONFIG.db_name}: {error}")
+        raise error
+
+
+@pytest_asyncio.fixture(scope="module")
+async def event_id(
+    http_service: Any,
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    clear_db: None,
+) -> str:
+    """Create a pristine event for each test module."""
+    url = f"{http_service}/events"
+    headers = auth_json_headers
+    request_body = {
+        "name": "Oslo Skagen sprint",
+        "date_of_event": "2021-08-31",
+        "time_of_event": "09:00:00",
+        "organiser": "Lyn Ski",
+        "webpage": "https://example.com",
+        "information": "Testarr for å teste den nye løysinga.",
+    }
+    async with http_session.post(url, headers=headers, json=request_body) as response:
+        response.raise_for_status()
+    # return the event_id, which is the last item of the path
+    return response.headers[hdrs.LOCATION].rsplit("/", 1)[-1]
+
+
+# ---
+async def upload_contestants(
+    http_session: ClientSession,
+    contestants_url: str,
+    headers: dict,
+    csv_bytes: bytes,
+    filename: str,
+) -> dict:
+    """Upload a csv-file of contestants and return the report."""
+    form = FormData()
+    form.add_field(
+        "file",
+        BytesIO(csv_bytes),
+        filename=filename,
+        content_type="text/csv",
+    )
+    async with http_session.post(
+        contestants_url, headers=headers, data=form
+    ) as response:
+        assert response.status == 200, await response.text()
+        assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
+        return await response.json(loads=orjson.loads)
+
+
+def with_group_order_and_ranking(
+    raceclass: dict, group_order_ranking: Dict[str, Tuple[int, int, bool]]
+) -> dict:
+    """Return a copy of the raceclass with group, order and ranking set.
+
+    Args:
+        raceclass: the raceclass as returned by the service.
+        group_order_ranking: group, order and ranking keyed on raceclass name.
+            A raceclass that is not in the mapping gets group 0, order 0 and
+            ranking, which puts it first in the start list.
+
+    Returns:
+        The raceclass with group, order and ranking from the mapping.
+    """
+    group, order, ranking = group_order_ranking.get(raceclass["name"], (0, 0, True))
+    return {**raceclass, "group": group, "order": order, "ranking": ranking}
+
+
+async def order_raceclasses(
+    http_session: ClientSession,
+    raceclasses_url: str,
+    headers: dict,
+    raceclasses: List[dict],
+    group_order_ranking: Dict[str, Tuple[int, int, bool]],
+) -> List[dict]:
+    """Store group, order and ranking from the mapping on every raceclass.
+
+    Returns:
+        The raceclasses as they were sent to the service.
+    """
+    updates = [
+        with_group_order_and_ranking(raceclass, group_order_ranking)
+        for raceclass in raceclasses
+    ]
+
+    async def _put_raceclass(raceclass: dict) -> None:
+        url = f"{raceclasses_url}/{raceclass['id']}"
+        async with http_session.put(url, headers=headers, json=raceclass) as response:
+            assert response.status == 204
+
+    # The raceclasses are independent, so they can be updated concurrently:
+    await asyncio.gather(*(_put_raceclass(raceclass) for raceclass in updates))
+    return updates
@@ -1,101 +1,48 @@
 """Contract test cases for contestants."""
-import copy
+import asyncio
 from datetime import date
-import logging
-import os
-from typing import Any, AsyncGenerator, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote
 
 
-from aiohttp import ClientSession, hdrs
-import motor.motor_asyncio
+from aiohttp import ClientResponse, ClientSession, hdrs
+import orjson
 import pytest
-from pytest_mock import MockFixture
-
-from event_service.utils import db_utils
-
-USERS_HOST_SERVER = os.getenv("USERS_HOST_SERVER")
-USERS_HOST_PORT = os.getenv("USERS_HOST_PORT")
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", 27017))
-DB_NAME = os.getenv("DB_NAME", "events_test")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-
-@pytest.fixture(scope="module")
-@pytest.mark.asyncio(scope="module")
-async def token(http_service: Any) -> str:
-    """Create a valid token."""
-    url = f"http://{USERS_HOST_SERVER}:{USERS_HOST_PORT}/login"
-    headers = {hdrs.CONTENT_TYPE: "application/json"}
-    request_body = {
-        "username": os.getenv("ADMIN_USERNAME"),
-        "password": os.getenv("ADMIN_PASSWORD"),
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        body = await response.json()
-    await session.close()
-    if response.status != 200:
-        logging.error(f"Got unexpected status {response.status} from {http_service}.")
-    return body["token"]
-
-
-@pytest.fixture(scope="module", autouse=True)
-@pytest.mark.asyncio(scope="module")
-async def clear_db() -> AsyncGenerator:
-    """Clear db before and after tests."""
-    mongo = motor.motor_asyncio.AsyncIOMotorClient(  # type: ignore
-        host=DB_HOST, port=DB_PORT, username=DB_USER, password=DB_PASSWORD
-    )
-    try:
-        await db_utils.drop_db_and_recreate_indexes(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-    yield
-
-    try:
-        await db_utils.drop_db(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-
-@pytest.fixture(scope="module")
-async def event_id(
-    http_service: Any, token: MockFixture, clear_db: AsyncGenerator
-) -> Optional[str]:
-    """Create an event object for testing."""
-    url = f"{http_service}/events"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-    request_body = {
-        "name": "Oslo Skagen sprint",
-        "date_of_event": "2021-08-31",
-        "time_of_event": "09:00:00",
-        "organiser": "Lyn Ski",
-        "webpage": "https://example.com",
-        "information": "Testarr for å teste den nye løysinga.",
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        status = response.status
-    await session.close()
-    if status == 201:
-        # return the event_id, which is the last item of the path
-        return response.headers[hdrs.LOCATION].split("/")[-1]
-    else:
-        logging.error(f"Got unsuccesful status when creating event: {status}.")
-        return None
+import pytest_asyncio
+
+from tests.contract.conftest import order_raceclasses, upload_contestants
+
+# group, order and ranking of each raceclass, keyed on raceclass name:
+GROUP_ORDER_RANKING: Dict[str, Tuple[int, int, bool]] = {
+    "KS": (1, 1, True),
+    "MS": (1, 2, True),
+    "M19-20": (1, 3, True),
+    "K19-20": (1, 4, True),
+    "M18": (2, 1, True),
+    "K18": (2, 2, True),
+    "M17": (3, 1, True),
+    "K17": (3, 2, True),
+    "G16": (4, 1, True),
+    "J16": (4, 2, True),
+    "G15": (4, 3, True),
+    "J15": (4, 4, True),
+    "G14": (5, 1, True),
+    "J14": (5, 2, True),
+    "G13": (5, 3, True),
+    "J13": (5, 4, True),
+    "G12": (6, 1, True),
+    "J12": (6, 2, True),
+    "G11": (6, 3, True),
+    "J11": (6, 4, True),
+    "G10": (7, 1, False),
+    "J10": (7, 2, False),
+    "G9": (8, 1, False),
+    "J9": (8, 2, False),
+}
 
 
 @pytest.fixture(scope="module")
-async def contestant(event_id: str) -> dict:
+def contestant(event_id: str) -> dict:
     """Create a contestant object for testing."""
     return {
         "first_name": "Cont E.",
@@ -112,141 +59,173 @@ async def contestant(event_id: str) -> dict:
     }
 
 
-@pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
-async def test_create_single_contestant(
+@pytest_asyncio.fixture(scope="module")
+async def created_contestant(
     http_service: Any,
-    token: MockFixture,
+    http_session: ClientSession,
+    auth_json_headers: dict,
     event_id: str,
     contestant: dict,
-) -> None:
-    """Should return 201 Created, location header and no body."""
+) -> Tuple[int, Optional[str]]:
+    """Post the single contestant once and return the status and location."""
     url = f"{http_service}/events/{event_id}/contestants"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
+    headers = auth_json_headers
     request_body = contestant
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        status = response.status
-    await session.close()
+    async with http_session.post(url, headers=headers, json=request_body) as response:
+        # Only status and headers are needed, the body is never read:
+        return response.status, response.headers.get(hdrs.LOCATION)
+
+
+@pytest.fixture(scope="module")
+def created_contestant_id(created_contestant: Tuple[int, Optional[str]]) -> str:
+    """Return the id of the single contestant, the last item of the location."""
+    _, location = created_contestant
+    assert location, "the single contestant was not created"
+    return location.rsplit("/", 1)[-1]
 
+
+@pytest_asyncio.fixture(scope="module")
+async def uploaded_contestants(
+    http_service: Any,
+    http_session: ClientSession,
+    auth_headers: dict,
+    event_id: str,
+    isonen_csv_bytes: bytes,
+) -> dict:
+    """Upload the iSonen csv-file once and return the report."""
+    url = f"{http_service}/events/{event_id}/contestants"
+    return await upload_contestants(
+        http_session, url, auth_headers, isonen_csv_bytes, "contestants_iSonen.csv"
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def raceclasses(
+    http_service: Any,
+    http_session: ClientSession,
+    auth_headers: dict,
+    event_id: str,
+    uploaded_contestants: dict,
+) -> list:
+    """Generate raceclasses unless the event already has them, and return them."""
+    url = f"{http_service}/events/{event_id}/raceclasses"
+    headers = auth_headers
+    async with http_session.get(url) as response:
+        assert response.status == 200
+        raceclasses = await response.json(loads=orjson.loads)
+    if raceclasses:
+        return raceclasses
+
+    generate_url = f"{http_service}/events/{event_id}/generate-raceclasses"
+    async with http_session.post(generate_url, headers=headers) as response:
+        assert response.status == 201
+
+    async with http_session.get(url) as response:
+        assert response.status == 200
+        return await response.json(loads=orjson.loads)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_event(
+    http_service: Any,
+    http_session: ClientSession,
+    auth_headers: dict,
+    event_id: str,
+    raceclasses: list,
+) -> str:
+    """Set order on all raceclasses and assign bibs once, and return the event_id."""
+    headers = auth_headers
+
+    # We need to set order for all raceclasses:
+    url = f"{http_service}/events/{event_id}/raceclasses"
+    await order_raceclasses(
+        http_session, url, headers, raceclasses, GROUP_ORDER_RANKING
+    )
+
+    # Then assign bibs to all contestants:
+    url = f"{http_service}/events/{event_id}/contestants/assign-bibs"
+    async with http_session.post(url, headers=headers) as response:
+        assert response.status == 201
+        assert f"/events/{event_id}/contestants" in response.headers[hdrs.LOCATION]
+
+    return event_id
+
+
+@pytest.mark.contract
+async def test_create_single_contestant(
+    event_id: str, created_contestant: Tuple[int, Optional[str]]
+) -> None:
+    """Should return 201 Created, location header and no body."""
+    status, location = created_contestant
     assert status == 201
-    assert f"/events/{event_id}/contestants/" in response.headers[hdrs.LOCATION]
+    assert location
+    assert f"/events/{event_id}/contestants/" in location
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_contestant_by_id(
-    http_service: Any, token: MockFixture, event_id: str, contestant: dict
+    http_service: Any,
+    http_session: ClientSession,
+    event_id: str,
+    contestant: dict,
+    created_contestant_id: str,
 ) -> None:
     """Should return OK and an contestant as json."""
-    url = f"{http_service}/events/{event_id}/contestants"
-
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            contestants = await response.json()
-        assert len(contestants) > 0
-        assert type(contestants) is list
-        id = contestants[0]["id"]
-        url = f"{url}/{id}"
-        async with session.get(url) as response:
-            body = await response.json()
+    url = f"{http_service}/events/{event_id}/contestants/{created_contestant_id}"
+    async with http_session.get(url) as response:
+        body = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
-    assert type(body) is dict
-    assert body["id"]
-    assert body["first_name"] == contestant["first_name"]
-    assert body["last_name"] == contestant["last_name"]
-    assert body["birth_date"] == contestant["birth_date"]
-    assert body["gender"] == contestant["gender"]
-    assert body["ageclass"] == contestant["ageclass"]
-    assert body["region"] == contestant["region"]
-    assert body["club"] == contestant["club"]
-    assert body["team"] == contestant["team"]
-    assert body["email"] == contestant["email"]
-    assert body["registration_date_time"] == contestant["registration_date_time"]
+    assert body["id"] == created_contestant_id
+    assert {key: body[key] for key in contestant} == contestant
     assert body["event_id"] == event_id
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_update_contestant(
-    http_service: Any, token: MockFixture, event_id: str, contestant: dict
+    http_service: Any,
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    event_id: str,
+    contestant: dict,
+    created_contestant_id: str,
 ) -> None:
     """Should return No Content."""
-    url = f"{http_service}/events/{event_id}/contestants"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            contestants = await response.json()
-        assert len(contestants) > 0
-        assert type(contestants) is list
-        id = contestants[0]["id"]
-        url = f"{url}/{id}"
-        request_body = copy.deepcopy(contestant)
-        request_body["id"] = id
-        request_body["last_name"] = "Updated name"
-        async with session.put(url, headers=headers, json=request_body) as response:
-            pass
+    url = f"{http_service}/events/{event_id}/contestants/{created_contestant_id}"
+    headers = auth_json_headers
 
-    assert response.status == 204
+    request_body = {
+        **contestant,
+        "id": created_contestant_id,
+        "last_name": "Updated name",
+    }
+    async with http_session.put(url, headers=headers, json=request_body) as response:
+        assert response.status == 204
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_delete_contestant(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any,
+    http_session: ClientSession,
+    auth_headers: dict,
+    event_id: str,
+    created_contestant_id: str,
 ) -> None:
     """Should return 204 No Content."""
-    url = f"{http_service}/events/{event_id}/contestants"
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            contestants = await response.json()
-        assert len(contestants) > 0
-        assert type(contestants) is list
-        id = contestants[0]["id"]
-        url = f"{url}/{id}"
-        async with session.delete(url, headers=headers) as response:
-            pass
+    url = f"{http_service}/events/{event_id}/contestants/{created_contestant_id}"
+    headers = auth_headers
 
-    assert response.status == 204
+    async with http_session.delete(url, headers=headers) as response:
+        assert response.status == 204
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_create_many_contestants_as_csv_file_from_iSonen(
-    http_service: Any,
-    token: MockFixture,
-    event_id: str,
+    uploaded_contestants: dict,
 ) -> None:
     """Should return 200 OK and a report."""
-    url = f"{http_service}/events/{event_id}/contestants"
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-
-    # Send csv-file in request:
-    files = {"file": open("tests/files/contestants_iSonen.csv", "rb")}
-    async with ClientSession() as session:
-        async with session.delete(url) as response:
-            pass
-        async with session.post(url, headers=headers, data=files) as response:
-            status = response.status
-            body = await response.json()
-
-    assert status == 200
-    assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
+    body = uploaded_contestants
 
     assert len(body) > 0
 
@@ -260,16 +239,14 @@ async def test_create_many_contestants_as_csv_file_from_iSonen(
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_all_contestants_in_given_event(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any, http_session: ClientSession, seeded_event: str
 ) -> None:
     """Should return OK and a list of contestants as json."""
-    url = f"{http_service}/events/{event_id}/contestants"
+    url = f"{http_service}/events/{seeded_event}/contestants"
 
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            contestants = await response.json()
+    async with http_session.get(url) as response:
+        contestants = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
@@ -278,25 +255,15 @@ async def test_get_all_contestants_in_given_event(
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_all_contestants_in_given_event_by_raceclass(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any, http_session: ClientSession, seeded_event: str
 ) -> None:
     """Should return OK and a list of contestants as json."""
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-    async with ClientSession() as session:
-        # In this case we have to generate raceclasses first:
-        url = f"{http_service}/events/{event_id}/generate-raceclasses"
-        async with session.post(url, headers=headers) as response:
-            assert response.status == 201
-
-        raceclass_parameter = "J13"
-        url = f"{http_service}/events/{event_id}/contestants?raceclass={raceclass_parameter}"
+    raceclass_parameter = "J13"
+    url = f"{http_service}/events/{seeded_event}/contestants"
 
-        async with session.get(url) as response:
-            contestants = await response.json()
+    async with http_session.get(f"{url}?raceclass={raceclass_parameter}") as response:
+        contestants = await response.json(loads=orjson.loads)
 
     assert response.status == 200, response
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
@@ -307,19 +274,18 @@ async def test_get_all_contestants_in_given_event_by_raceclass(
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_all_contestants_in_given_event_by_ageclass(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any,
+    http_session: ClientSession,
+    auth_headers: dict,
+    seeded_event: str,
 ) -> None:
     """Should return OK and a list of contestants as json."""
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-    async with ClientSession() as session:
-        query_param = f'ageclass={quote("Jenter 13")}'
-        url = f"{http_service}/events/{event_id}/contestants"
-        async with session.get(f"{url}?{query_param}", headers=headers) as response:
-            contestants = await response.json()
+    headers = auth_headers
+    query_param = f'ageclass={quote("Jenter 13")}'
+    url = f"{http_service}/events/{seeded_event}/contestants"
+    async with http_session.get(f"{url}?{query_param}", headers=headers) as response:
+        contestants = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
@@ -330,153 +296,71 @@ async def test_get_all_contestants_in_given_event_by_ageclass(
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_all_contestants_in_given_event_by_bib(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any, http_session: ClientSession, seeded_event: str
 ) -> None:
     """Should return OK and a list with exactly contestant as json."""
     bib = 1
 
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-
-    async with ClientSession() as session:
-        # Also we need to set order for all raceclasses:
-        url = f"{http_service}/events/{event_id}/raceclasses"
-        async with session.get(url) as response:
-            assert response.status == 200
-            raceclasses = await response.json()
-            for raceclass in raceclasses:
-                id = raceclass["id"]
-                (
-                    raceclass["group"],
-                    raceclass["order"],
-                    raceclass["ranking"],
-                ) = await _decide_group_order_and_ranking(raceclass)
-                async with session.put(
-                    f"{url}/{id}", headers=headers, json=raceclass
-                ) as response:
-                    assert response.status == 204
-
-        # Finally assign bibs to all contestants:
-        url = f"{http_service}/events/{event_id}/contestants/assign-bibs"
-        async with session.post(url, headers=headers) as response:
-            assert response.status == 201
-            assert f"/events/{event_id}/contestants" in response.headers[hdrs.LOCATION]
-
-        # We can now get the contestants
-        url = f"{http_service}/events/{event_id}/contestants"
-        async with session.get(url) as response:
-            contestants = await response.json()
-        assert response.status == 200
-        assert len(contestants) > 0
-        # We can now get the contestant by bib.
-        url = f"{http_service}/events/{event_id}/contestants?bib={bib}"
-        async with session.get(url) as response:
-            contestants_with_bib = await response.json()
+    # We can get the contestants and the contestant by bib concurrently:
+    url = f"{http_service}/events/{seeded_event}/contestants"
+    results = await asyncio.gather(
+        _get_json(http_session, url),
+        _get_json(http_session, f"{url}?bib={bib}"),
+    )
+    (response, contestants), (response_with_bib, contestants_with_bib) = results
+    assert response.status == 200
+    assert len(contestants) > 0
 
-        assert response.status == 200
-        assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
-        assert type(contestants_with_bib) is list
-        assert len(contestants_with_bib) == 1
-        assert contestants_with_bib[0]["bib"] == 1
+    assert response_with_bib.status == 200
+    assert "application/json" in response_with_bib.headers[hdrs.CONTENT_TYPE]
+    assert type(contestants_with_bib) is list
+    assert len(contestants_with_bib) == 1
+    assert contestants_with_bib[0]["bib"] == 1
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_search_contestant_by_name(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any,
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    seeded_event: str,
 ) -> None:
     """Should return 200 OK."""
-    url = f"{http_service}/events/{event_id}/contestants/search"
+    url = f"{http_service}/events/{seeded_event}/contestants/search"
     body = {"name": "Turid"}
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-        hdrs.CONTENT_TYPE: "application/json",
-    }
+    headers = auth_json_headers
 
-    async with ClientSession() as session:
-        async with session.post(url, headers=headers, json=body) as response:
-            if response.status != 200:
-                body = await response.json()
-            assert response.status == 200, body
-            contestants = await response.json()
+    async with http_session.post(url, headers=headers, json=body) as response:
+        contestants = await response.json(loads=orjson.loads)
+        assert response.status == 200, contestants
 
     assert len(contestants) == 1
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_delete_all_contestant(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any, http_session: ClientSession, auth_headers: dict, event_id: str
 ) -> None:
-    """Should return 204 No Content."""
+    """Should return 204 No Content.
+
+    This test empties the seeded event, so it must stay last in the module.
+    """
     url = f"{http_service}/events/{event_id}/contestants"
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
+    headers = auth_headers
 
-    async with ClientSession() as session:
-        async with session.delete(url, headers=headers) as response:
-            assert response.status == 204
+    async with http_session.delete(url, headers=headers) as response:
+        assert response.status == 204
 
-        async with session.get(url) as response:
-            assert response.status == 200
-            contestants = await response.json()
-            assert len(contestants) == 0
+    async with http_session.get(url) as response:
+        assert response.status == 200
+        contestants = await response.json(loads=orjson.loads)
+        assert len(contestants) == 0
 
 
 # ---
-async def _decide_group_order_and_ranking(  # noqa: C901
-    raceclass: dict,
-) -> Tuple[int, int, bool]:
-    if raceclass["name"] == "KS":
-        return (1, 1, True)
-    elif raceclass["name"] == "MS":
-        return (1, 2, True)
-    elif raceclass["name"] == "M19-20":
-        return (1, 3, True)
-    elif raceclass["name"] == "K19-20":
-        return (1, 4, True)
-    elif raceclass["name"] == "M18":
-        return (2, 1, True)
-    elif raceclass["name"] == "K18":
-        return (2, 2, True)
-    elif raceclass["name"] == "M17":
-        return (3, 1, True)
-    elif raceclass["name"] == "K17":
-        return (3, 2, True)
-    elif raceclass["name"] == "G16":
-        return (4, 1, True)
-    elif raceclass["name"] == "J16":
-        return (4, 2, True)
-    elif raceclass["name"] == "G15":
-        return (4, 3, True)
-    elif raceclass["name"] == "J15":
-        return (4, 4, True)
-    elif raceclass["name"] == "G14":
-        return (5, 1, True)
-    elif raceclass["name"] == "J14":
-        return (5, 2, True)
-    elif raceclass["name"] == "G13":
-        return (5, 3, True)
-    elif raceclass["name"] == "J13":
-        return (5, 4, True)
-    elif raceclass["name"] == "G12":
-        return (6, 1, True)
-    elif raceclass["name"] == "J12":
-        return (6, 2, True)
-    elif raceclass["name"] == "G11":
-        return (6, 3, True)
-    elif raceclass["name"] == "J11":
-        return (6, 4, True)
-    elif raceclass["name"] == "G10":
-        return (7, 1, False)
-    elif raceclass["name"] == "J10":
-        return (7, 2, False)
-    elif raceclass["name"] == "G9":
-        return (8, 1, False)
-    elif raceclass["name"] == "J9":
-        return (8, 2, False)
-    return (0, 0, True)  # should not reach this point
+async def _get_json(session: ClientSession, url: str) -> Tuple[ClientResponse, Any]:
+    """GET url and return the released response together with its decoded body."""
+    async with session.get(url) as response:
+        return response, await response.json(loads=orjson.loads)
+
@@ -1,71 +1,18 @@
 """Contract test cases for ping."""
-from copy import deepcopy
-from json import load
-import logging
 import os
-from typing import Any, AsyncGenerator
+from typing import Any, Optional, Tuple
 
 from aiohttp import ClientSession, ContentTypeError, hdrs
-import motor.motor_asyncio
+import orjson
 import pytest
-from pytest_mock import MockFixture
-
-from event_service.utils import db_utils
+import pytest_asyncio
 
 COMPETITION_FORMAT_HOST_SERVER = os.getenv("COMPETITION_FORMAT_HOST_SERVER")
 COMPETITION_FORMAT_HOST_PORT = os.getenv("COMPETITION_FORMAT_HOST_PORT")
-USERS_HOST_SERVER = os.getenv("USERS_HOST_SERVER")
-USERS_HOST_PORT = os.getenv("USERS_HOST_PORT")
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", 27017))
-DB_NAME = os.getenv("DB_NAME", "events_test")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-
-@pytest.fixture(scope="module")
-@pytest.mark.asyncio(scope="module")
-async def token(http_service: Any) -> str:
-    """Create a valid token."""
-    url = f"http://{USERS_HOST_SERVER}:{USERS_HOST_PORT}/login"
-    headers = {hdrs.CONTENT_TYPE: "application/json"}
-    request_body = {
-        "username": os.getenv("ADMIN_USERNAME"),
-        "password": os.getenv("ADMIN_PASSWORD"),
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        body = await response.json()
-    await session.close()
-    if response.status != 200:
-        logging.error(f"Got unexpected status {response.status} from {http_service}.")
-    return body["token"]
-
-
-@pytest.fixture(scope="module", autouse=True)
-@pytest.mark.asyncio(scope="module")
-async def clear_db() -> AsyncGenerator:
-    """Delete all events before we start."""
-    mongo = motor.motor_asyncio.AsyncIOMotorClient(  # type: ignore
-        host=DB_HOST, port=DB_PORT, username=DB_USER, password=DB_PASSWORD
-    )
-    try:
-        await db_utils.drop_db_and_recreate_indexes(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-    yield
-
-    try:
-        await db_utils.drop_db(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
 
 
-@pytest.fixture(scope="module")
-async def event() -> dict:
+@pytest.fixture(scope="session")
+def event() -> dict:
     """An event object for testing."""
     return {
         "name": "Oslo Skagen sprint",
@@ -79,157 +26,152 @@ async def event() -> dict:
     }
 
 
-@pytest.fixture(scope="module")
-async def competition_format_interval_start() -> dict:
+@pytest.fixture(scope="session")
+def competition_format_interval_start() -> dict:
     """An competition_format object for testing."""
-    with open("tests/files/competition_format_interval_start.json", "r") as file:
-        competition_format = load(file)
-    return competition_format
+    with open("tests/files/competition_format_interval_start.json", "rb") as file:
+        return orjson.loads(file.read())
 
 
-@pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
-async def test_create_event(
-    http_service: Any,
-    token: MockFixture,
-    clear_db: AsyncGenerator,
-    event: dict,
+@pytest.fixture(scope="module")
+def events_url(http_service: Any) -> str:
+    """Url to the events."""
+    return f"{http_service}/events"
+
+
+@pytest_asyncio.fixture(scope="module")
+async def competition_format_created(
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    clear_db: None,
     competition_format_interval_start: dict,
 ) -> None:
-    """Should return Created, location header and no body."""
-    async with ClientSession() as session:
-        headers = {
-            hdrs.CONTENT_TYPE: "application/json",
-            hdrs.AUTHORIZATION: f"Bearer {token}",
-        }
-        # We have to create a competition_format:
-        url = f"http://{COMPETITION_FORMAT_HOST_SERVER}:{COMPETITION_FORMAT_HOST_PORT}/competition-formats"  # noqa: B950
-        request_body = competition_format_interval_start
-        async with session.post(url, headers=headers, json=request_body) as response:
-            try:
-                body = await response.json()
-            except ContentTypeError:
-                body = None
-                pass
-
-            status = response.status
-            assert status == 201, f"{body}" if body else ""
-
-        # Now we can create an event:
-        url = f"{http_service}/events"
-        request_body = event
-
-        async with session.post(url, headers=headers, json=request_body) as response:
-            try:
-                body = await response.json()
-            except ContentTypeError:
-                body = None
-                pass
-
-            status = response.status
+    """Create the competition_format in the competition-format service."""
+    headers = auth_json_headers
+    url = f"http://{COMPETITION_FORMAT_HOST_SERVER}:{COMPETITION_FORMAT_HOST_PORT}/competition-formats"  # noqa: B950
+    request_body = competition_format_interval_start
+    async with http_session.post(url, headers=headers, json=request_body) as response:
+        try:
+            body = await response.json(loads=orjson.loads)
+        except ContentTypeError:
+            body = None
+            pass
+
+        status = response.status
         assert status == 201, f"{body}" if body else ""
-        assert "/events/" in response.headers[hdrs.LOCATION]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def created_event(
+    events_url: str,
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    clear_db: None,
+    event: dict,
+    competition_format_created: None,
+) -> Tuple[int, Optional[str], Any]:
+    """Post the event once and return the status, location and any body."""
+    headers = auth_json_headers
+    url = events_url
+    request_body = event
+
+    async with http_session.post(url, headers=headers, json=request_body) as response:
+        try:
+            body = await response.json(loads=orjson.loads)
+        except ContentTypeError:
+            body = None
+            pass
+
+        return response.status, response.headers.get(hdrs.LOCATION), body
+
+
+@pytest.fixture(scope="module")
+def created_event_id(created_event: Tuple[int, Optional[str], Any]) -> str:
+    """Return the id of the event, which is the last item of the location."""
+    _, location, body = created_event
+    assert location, f"{body}" if body else "the event was not created"
+    return location.rsplit("/", 1)[-1]
+
+
+@pytest.mark.contract
+async def test_create_event(created_event: Tuple[int, Optional[str], Any]) -> None:
+    """Should return Created, location header and no body."""
+    status, location, body = created_event
+    assert status == 201, f"{body}" if body else ""
+    assert location
+    assert "/events/" in location
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
-async def test_get_all_events(http_service: Any, token: MockFixture) -> None:
+async def test_get_all_events(events_url: str, http_session: ClientSession) -> None:
     """Should return OK and a list of events as json."""
-    url = f"{http_service}/events"
+    url = events_url
 
-    session = ClientSession()
-    async with session.get(url) as response:
-        events = await response.json()
-    await session.close()
+    async with http_session.get(url) as response:
+        events = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
-    assert type(events) is list
+    assert isinstance(events, list)
     assert len(events) > 0
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_event_by_id(
-    http_service: Any, token: MockFixture, event: dict
+    events_url: str,
+    http_session: ClientSession,
+    event: dict,
+    created_event_id: str,
 ) -> None:
     """Should return OK and an event as json."""
-    url = f"{http_service}/events"
-
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            events = await response.json()
-        id = events[0]["id"]
-        url = f"{url}/{id}"
-        async with session.get(url) as response:
-            body = await response.json()
+    url = f"{events_url}/{created_event_id}"
+    async with http_session.get(url) as response:
+        body = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
-    assert type(event) is dict
-    assert body["id"] == id
-    assert body["name"] == event["name"]
-    assert body["competition_format"] == event["competition_format"]
-    assert body["date_of_event"] == event["date_of_event"]
-    assert body["time_of_event"] == event["time_of_event"]
-    assert body["timezone"] == event["timezone"]
-    assert body["organiser"] == event["organiser"]
-    assert body["webpage"] == event["webpage"]
-    assert body["information"] == event["information"]
+    assert isinstance(body, dict)
+    assert body["id"] == created_event_id
+    assert {key: body[key] for key in event} == event
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
-async def test_update_event(http_service: Any, token: MockFixture, event: dict) -> None:
+async def test_update_event(
+    events_url: str,
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    event: dict,
+    created_event_id: str,
+) -> None:
     """Should return No Content."""
-    url = f"{http_service}/events"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            events = await response.json()
-        id = events[0]["id"]
-        url = f"{url}/{id}"
+    url = f"{events_url}/{created_event_id}"
+    headers = auth_json_headers
 
-        request_body = deepcopy(event)
-        new_name = "Oslo Skagen sprint updated"
-        request_body["id"] = id
-        request_body["name"] = new_name
+    new_name = "Oslo Skagen sprint updated"
+    request_body = {**event, "id": created_event_id, "name": new_name}
 
-        async with session.put(url, headers=headers, json=request_body) as response:
-            assert response.status == 204
+    async with http_session.put(url, headers=headers, json=request_body) as response:
+        assert response.status == 204
 
-        async with session.get(url) as response:
-            assert response.status == 200
-            updated_event = await response.json()
-            assert updated_event["name"] == new_name
-            assert updated_event["competition_format"] == event["competition_format"]
-            assert updated_event["date_of_event"] == event["date_of_event"]
-            assert updated_event["time_of_event"] == event["time_of_event"]
-            assert updated_event["organiser"] == event["organiser"]
-            assert updated_event["webpage"] == event["webpage"]
-            assert updated_event["information"] == event["information"]
+    async with http_session.get(url) as response:
+        assert response.status == 200
+        updated_event = await response.json(loads=orjson.loads)
+        assert {key: updated_event[key] for key in request_body} == request_body
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
-async def test_delete_event(http_service: Any, token: MockFixture) -> None:
+async def test_delete_event(
+    events_url: str,
+    http_session: ClientSession,
+    auth_headers: dict,
+    created_event_id: str,
+) -> None:
     """Should return No Content."""
-    url = f"{http_service}/events"
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
+    url = f"{events_url}/{created_event_id}"
+    headers = auth_headers
 
-    async with ClientSession() as session:
-        async with session.get(url) as response:
-            events = await response.json()
-        id = events[0]["id"]
-        url = f"{url}/{id}"
-        async with session.delete(url, headers=headers) as response:
-            assert response.status == 204
+    async with http_session.delete(url, headers=headers) as response:
+        assert response.status == 204
 
-        async with session.get(url) as response:
-            assert response.status == 404
+    async with http_session.get(url) as response:
+        assert response.status == 404
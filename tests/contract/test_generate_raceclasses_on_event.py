@@ -1,223 +1,106 @@
 """Contract test cases for generate-raceclass command."""
-import logging
-import os
-from typing import Any, AsyncGenerator, Optional
+import asyncio
+from collections import Counter
+from typing import Any, List, Tuple
 
 from aiohttp import ClientSession, hdrs
-import motor.motor_asyncio
+import orjson
 import pytest
-from pytest_mock import MockFixture
-
-from event_service.utils import db_utils
-
-USERS_HOST_SERVER = os.getenv("USERS_HOST_SERVER")
-USERS_HOST_PORT = os.getenv("USERS_HOST_PORT")
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", 27017))
-DB_NAME = os.getenv("DB_NAME", "events_test")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-
-@pytest.fixture(scope="module")
-@pytest.mark.asyncio(scope="module")
-async def token(http_service: Any) -> str:
-    """Create a valid token."""
-    url = f"http://{USERS_HOST_SERVER}:{USERS_HOST_PORT}/login"
-    headers = {hdrs.CONTENT_TYPE: "application/json"}
-    request_body = {
-        "username": os.getenv("ADMIN_USERNAME"),
-        "password": os.getenv("ADMIN_PASSWORD"),
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        body = await response.json()
-    await session.close()
-    if response.status != 200:
-        logging.error(f"Got unexpected status {response.status} from {http_service}.")
-    return body["token"]
-
-
-@pytest.fixture(scope="function", autouse=True)
-@pytest.mark.asyncio(scope="module")
-async def clear_db() -> AsyncGenerator:
-    """Delete all events before we start."""
-    mongo = motor.motor_asyncio.AsyncIOMotorClient(  # type: ignore
-        host=DB_HOST, port=DB_PORT, username=DB_USER, password=DB_PASSWORD
-    )
-    try:
-        await db_utils.drop_db_and_recreate_indexes(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-    yield
-
-    try:
-        await db_utils.drop_db(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-
-@pytest.fixture(scope="function")
-async def event_id(
-    http_service: Any, token: MockFixture, clear_db: AsyncGenerator
-) -> Optional[str]:
-    """Create an event object for testing."""
-    url = f"{http_service}/events"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-    request_body = {
-        "name": "Oslo Skagen sprint",
-        "date_of_event": "2021-09-11",
-        "tim_of_event": "09:00:00",
-        "organiser": "Lyn Ski",
-        "webpage": "https://example.com",
-        "information": "Testarr for å teste den nye løysinga.",
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        status = response.status
-    await session.close()
-    if status == 201:
-        # return the event_id, which is the last item of the path
-        return response.headers[hdrs.LOCATION].split("/")[-1]
-    else:
-        logging.error(f"Got unsuccesful status when creating event: {status}.")
-        return None
+
+from tests.contract.conftest import upload_contestants
+
+# The raceclasses generated from the iSonen file, sorted by name, and their ageclass:
+RACECLASS_AGECLASSES: List[Tuple[str, str]] = [
+    ("G11", "Gutter 11"),
+    ("G12", "Gutter 12"),
+    ("G13", "Gutter 13"),
+    ("G14", "Gutter 14"),
+    ("G15", "Gutter 15"),
+    ("G16", "Gutter 16"),
+    ("J11", "Jenter 11"),
+    ("J13", "Jenter 13"),
+    ("J14", "Jenter 14"),
+    ("J15", "Jenter 15"),
+    ("J16", "Jenter 16"),
+    ("K17", "Kvinner 17"),
+    ("K18", "Kvinner 18"),
+    ("K19-20", "Kvinner 19-20"),
+    ("KS", "Kvinner senior"),
+    ("M17", "Menn 17"),
+    ("M18", "Menn 18"),
+    ("M19-20", "Menn 19-20"),
+    ("MS", "Menn senior"),
+]
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_generate_raceclasses(
-    http_service: Any, token: MockFixture, event_id: str
+    http_service: Any,
+    http_session: ClientSession,
+    auth_headers: dict,
+    event_id: str,
+    isonen_csv_bytes: bytes,
 ) -> None:
     """Should return 201 created and a location header with url to raceclasses."""
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-
-    async with ClientSession() as session:
-        # First we need to find assert that we have an event:
-        url = f"{http_service}/events/{event_id}"
-        async with session.get(url) as response:
-            assert response.status == 200
+    headers = auth_headers
+
+    event_url = f"{http_service}/events/{event_id}"
+    contestants_url = f"{event_url}/contestants"
 
-        # Then we add contestants to event:
-        url = f"{http_service}/events/{event_id}/contestants"
-        files = {"file": open("tests/files/contestants_iSonen.csv", "rb")}
-        async with session.post(url, headers=headers, data=files) as response:
+    async def _assert_event_exists() -> None:
+        async with http_session.get(event_url) as response:
             assert response.status == 200
 
-        # We get the list of contestants:
-        url = f"{http_service}/events/{event_id}/contestants"
-        async with session.get(url, headers=headers) as response:
+    # The event exists from the fixture, so checking it and adding contestants
+    # to it can overlap:
+    await asyncio.gather(
+        _assert_event_exists(),
+        upload_contestants(
+            http_session,
+            contestants_url,
+            headers,
+            isonen_csv_bytes,
+            "contestants_iSonen.csv",
+        ),
+    )
+
+    async def _get_contestants() -> list:
+        async with http_session.get(contestants_url, headers=headers) as response:
             assert response.status == 200
-            contestants = await response.json()
-
-        # Finally raceclasses are generated:
-        url = f"{http_service}/events/{event_id}/generate-raceclasses"
-        async with session.post(url, headers=headers) as response:
-            if response.status != 201:
-                body = await response.json()
-            assert response.status == 201, body
+            return await response.json(loads=orjson.loads)
+
+    async def _generate_raceclasses() -> str:
+        url = f"{event_url}/generate-raceclasses"
+        async with http_session.post(url, headers=headers) as response:
+            # The body is only read to explain a failure:
+            assert response.status == 201, await response.text()
             assert f"/events/{event_id}/raceclasses" in response.headers[hdrs.LOCATION]
+            return response.headers[hdrs.LOCATION]
 
-        # We check that 19 raceclasses are actually created:
-        url = response.headers[hdrs.LOCATION]
-        async with session.get(url) as response:
-            assert response.status == 200
-            raceclasses = await response.json()
-            assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
-            assert type(raceclasses) is list
-
-            # Check that we have 19 raceclasses:
-            assert len(raceclasses) == 19
-
-            # Check sum of contestants is equal to total no of contestants:
-            assert sum(item["no_of_contestants"] for item in raceclasses) == len(
-                contestants
-            )
-
-            # Check that we have all raceclasses and that sum pr class is correct:
-            sorted_list = sorted(raceclasses, key=lambda k: k["name"])
-
-            assert sorted_list[0]["name"] == "G11"
-            assert sorted_list[0]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Gutter 11"]
-            )
-            assert sorted_list[1]["name"] == "G12"
-            assert sorted_list[1]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Gutter 12"]
-            )
-            assert sorted_list[2]["name"] == "G13"
-            assert sorted_list[2]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Gutter 13"]
-            )
-            assert sorted_list[3]["name"] == "G14"
-            assert sorted_list[3]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Gutter 14"]
-            )
-            assert sorted_list[4]["name"] == "G15"
-            assert sorted_list[4]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Gutter 15"]
-            )
-            assert sorted_list[5]["name"] == "G16"
-            assert sorted_list[5]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Gutter 16"]
-            )
-            assert sorted_list[6]["name"] == "J11"
-            assert sorted_list[6]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Jenter 11"]
-            )
-            assert sorted_list[7]["name"] == "J13"
-            assert sorted_list[7]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Jenter 13"]
-            )
-            assert sorted_list[8]["name"] == "J14"
-            assert sorted_list[8]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Jenter 14"]
-            )
-            assert sorted_list[9]["name"] == "J15"
-            assert sorted_list[9]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Jenter 15"]
-            )
-            assert sorted_list[10]["name"] == "J16"
-            assert sorted_list[10]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Jenter 16"]
-            )
-            assert sorted_list[11]["name"] == "K17"
-            assert sorted_list[11]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Kvinner 17"]
-            )
-            assert sorted_list[12]["name"] == "K18"
-            assert sorted_list[12]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Kvinner 18"]
-            )
-            assert sorted_list[13]["name"] == "K19-20"
-            assert sorted_list[13]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Kvinner 19-20"]
-            )
-            assert sorted_list[14]["name"] == "KS"
-            assert sorted_list[14]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Kvinner senior"]
-            )
-            assert sorted_list[15]["name"] == "M17"
-            assert sorted_list[15]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Menn 17"]
-            )
-            assert sorted_list[16]["name"] == "M18"
-            assert sorted_list[16]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Menn 18"]
-            )
-            assert sorted_list[17]["name"] == "M19-20"
-            assert sorted_list[17]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Menn 19-20"]
-            )
-            assert sorted_list[18]["name"] == "MS"
-            assert sorted_list[18]["no_of_contestants"] == len(
-                [c for c in contestants if c["ageclass"] == "Menn senior"]
-            )
+    # Generating raceclasses does not change the contestants we compare with:
+    contestants, raceclasses_url = await asyncio.gather(
+        _get_contestants(), _generate_raceclasses()
+    )
+    contestants_per_ageclass = Counter(c["ageclass"] for c in contestants)
+
+    # We check that 19 raceclasses are actually created:
+    async with http_session.get(raceclasses_url) as response:
+        assert response.status == 200
+        raceclasses = await response.json(loads=orjson.loads)
+        assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
+        assert type(raceclasses) is list
+
+        # Check that we have 19 raceclasses:
+        assert len(raceclasses) == 19
+
+        # Check sum of contestants is equal to total no of contestants:
+        assert sum(item["no_of_contestants"] for item in raceclasses) == len(
+            contestants
+        )
+
+        # Check that we have all raceclasses and that sum pr class is correct:
+        sorted_list = sorted(raceclasses, key=lambda k: k["name"])
+
+        for raceclass, (name, ageclass) in zip(sorted_list, RACECLASS_AGECLASSES):
+            assert raceclass["name"] == name
+            assert raceclass["no_of_contestants"] == contestants_per_ageclass[ageclass]
@@ -6,15 +6,12 @@ import pytest
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_ready(http_service: Any) -> None:
+async def test_ready(http_service: Any, http_session: ClientSession) -> None:
     """Should return OK."""
     url = f"{http_service}/ready"
 
-    session = ClientSession()
-    async with session.get(url) as response:
+    async with http_session.get(url) as response:
         text = await response.text()
-    await session.close()
 
     assert response.status == 200
     assert text == "OK"
@@ -1,96 +1,13 @@
 """Contract test cases for results."""
-import logging
-import os
-from typing import Any, AsyncGenerator, Optional
+from typing import Any
 
 from aiohttp import ClientSession, hdrs
-import motor.motor_asyncio
+import orjson
 import pytest
-from pytest_mock import MockFixture
-
-from event_service.utils import db_utils
-
-USERS_HOST_SERVER = os.getenv("USERS_HOST_SERVER")
-USERS_HOST_PORT = os.getenv("USERS_HOST_PORT")
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", 27017))
-DB_NAME = os.getenv("DB_NAME", "events_test")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-
-@pytest.fixture(scope="module")
-@pytest.mark.asyncio(scope="module")
-async def token(http_service: Any) -> str:
-    """Create a valid token."""
-    url = f"http://{USERS_HOST_SERVER}:{USERS_HOST_PORT}/login"
-    headers = {hdrs.CONTENT_TYPE: "application/json"}
-    request_body = {
-        "username": os.getenv("ADMIN_USERNAME"),
-        "password": os.getenv("ADMIN_PASSWORD"),
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        body = await response.json()
-    await session.close()
-    if response.status != 200:
-        logging.error(f"Got unexpected status {response.status} from {http_service}.")
-    return body["token"]
-
-
-@pytest.fixture(scope="module", autouse=True)
-@pytest.mark.asyncio(scope="module")
-async def clear_db() -> AsyncGenerator:
-    """Delete all events before we start."""
-    mongo = motor.motor_asyncio.AsyncIOMotorClient(  # type: ignore
-        host=DB_HOST, port=DB_PORT, username=DB_USER, password=DB_PASSWORD
-    )
-    try:
-        await db_utils.drop_db_and_recreate_indexes(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-    yield
-
-    try:
-        await db_utils.drop_db(mongo, DB_NAME)
-    except Exception as error:
-        logging.error(f"Failed to drop database {DB_NAME}: {error}")
-        raise error
-
-
-@pytest.fixture(scope="module")
-async def event_id(
-    http_service: Any, token: MockFixture, clear_db: AsyncGenerator
-) -> Optional[str]:
-    """Create an event object for testing."""
-    url = f"{http_service}/events"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
-    request_body = {
-        "name": "Oslo Skagen sprint",
-        "date": "2021-08-31",
-        "organiser": "Lyn Ski",
-        "webpage": "https://example.com",
-        "information": "Testarr for å teste den nye løysinga.",
-    }
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        status = response.status
-    await session.close()
-    if status == 201:
-        # return the event_id, which is the last item of the path
-        return response.headers[hdrs.LOCATION].split("/")[-1]
-    else:
-        logging.error(f"Got unsuccesful status when creating event: {status}.")
-        return None
 
 
 @pytest.fixture(scope="module")
-async def new_result(event_id: str) -> dict:
+def new_result(event_id: str) -> dict:
     """Create a result object for testing."""
     return {
         "event_id": event_id,
@@ -106,39 +23,36 @@ async def new_result(event_id: str) -> dict:
     }
 
 
+@pytest.fixture(scope="module")
+def results_url(http_service: Any, event_id: str) -> str:
+    """Url to the results of the event."""
+    return f"{http_service}/events/{event_id}/results"
+
+
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_create_result(
-    http_service: Any, token: MockFixture, event_id: str, new_result: dict
+    http_session: ClientSession,
+    auth_json_headers: dict,
+    event_id: str,
+    results_url: str,
+    new_result: dict,
 ) -> None:
     """Should return Created, location header and no body."""
-    url = f"{http_service}/events/{event_id}/results"
-    headers = {
-        hdrs.CONTENT_TYPE: "application/json",
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
+    url = results_url
+    headers = auth_json_headers
     request_body = new_result
-    session = ClientSession()
-    async with session.post(url, headers=headers, json=request_body) as response:
-        status = response.status
-    await session.close()
-
-    assert status == 201
-    assert f"/events/{event_id}/results/" in response.headers[hdrs.LOCATION]
+    async with http_session.post(url, headers=headers, json=request_body) as response:
+        assert response.status == 201
+        assert f"/events/{event_id}/results/" in response.headers[hdrs.LOCATION]
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
-async def test_get_all_results(
-    http_service: Any, token: MockFixture, event_id: str
-) -> None:
+async def test_get_all_results(http_session: ClientSession, results_url: str) -> None:
     """Should return OK and a list of results as json."""
-    url = f"{http_service}/events/{event_id}/results"
+    url = results_url
 
-    session = ClientSession()
-    async with session.get(url) as response:
-        results = await response.json()
-    await session.close()
+    async with http_session.get(url) as response:
+        results = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
@@ -147,18 +61,15 @@ async def test_get_all_results(
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_get_result_by_raceclass(
-    http_service: Any, token: MockFixture, event_id: str
+    http_session: ClientSession, results_url: str
 ) -> None:
     """Should return OK and result of one raceclass as json."""
     name_parameter = "G12"
-    url = f"{http_service}/events/{event_id}/results/{name_parameter}"
+    url = f"{results_url}/{name_parameter}"
 
-    session = ClientSession()
-    async with session.get(url) as response:
-        result = await response.json()
-    await session.close()
+    async with http_session.get(url) as response:
+        result = await response.json(loads=orjson.loads)
 
     assert response.status == 200
     assert "application/json" in response.headers[hdrs.CONTENT_TYPE]
@@ -167,17 +78,13 @@ async def test_get_result_by_raceclass(
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio(scope="module")
 async def test_delete_result(
-    http_service: Any, token: MockFixture, event_id: str
+    http_session: ClientSession, auth_headers: dict, results_url: str
 ) -> None:
     """Should return 204 No Content."""
     name_parameter = "G12"
-    url = f"{http_service}/events/{event_id}/results/{name_parameter}"
-    headers = {
-        hdrs.AUTHORIZATION: f"Bearer {token}",
-    }
+    url = f"{results_url}/{name_parameter}"
+    headers = auth_headers
 
-    async with ClientSession() as session:
-        async with session.delete(url, headers=headers) as response:
-            assert response.status == 204
+    async with http_session.delete(url, headers=headers) as response:
+        assert response.status == 204
@@ -1,7 +1,7 @@
 """Integration test cases for the contestant route."""
 from datetime import date
 import os
-from typing import Any, List
+from typing import List
 
 from aiohttp import hdrs
 from aiohttp.test_utils import TestClient as _TestClient
@@ -129,18 +129,6 @@ async def contestants() -> List[dict]:
     return CONTESTANT_LIST
 
 
-def get_contestant_by_id(arg1: Any, event_id: str, contestant_id: str) -> dict:
-    """Look up correct contestant in list."""
-    return next(item for item in CONTESTANT_LIST if item["id"] == contestant_id)
-
-
-def update_contestant(
-    arg1: Any, event_id: str, contestant_id: str, contestant: dict
-) -> dict:
-    """Return the update contestant."""
-    return contestant
-
-
 @pytest.mark.integration
 async def test_assign_bibs_to_contestants(
     client: _TestClient,
@@ -163,16 +151,8 @@ async def test_assign_bibs_to_contestants(
         "event_service.adapters.contestants_adapter.ContestantsAdapter.get_all_contestants",
         return_value=contestants,
     )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_id",
-        side_effect=get_contestant_by_id,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",
-        side_effect=update_contestant,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_bib",
+    update_bibs = mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_bibs",
         return_value=None,
     )
 
@@ -189,6 +169,10 @@ async def test_assign_bibs_to_contestants(
         )
         assert resp.status == 201
         assert f"/events/{event_id}/contestants" in resp.headers[hdrs.LOCATION]
+        update_bibs.assert_called_once()
+        bibs = update_bibs.call_args.args[2]
+        assert set(bibs.keys()) == {c["id"] for c in contestants}
+        assert sorted(bibs.values()) == list(range(1, len(contestants) + 1))
 
 
 # Bad cases
@@ -287,12 +271,8 @@ async def test_assign_bibs_to_contestants_raceclasses_without_group(
         return_value=contestants,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_id",
-        side_effect=get_contestant_by_id,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",
-        side_effect=update_contestant,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_bibs",
+        return_value=None,
     )
 
     headers = {
@@ -332,12 +312,8 @@ async def test_assign_bibs_to_contestants_raceclasses_without_order(
         return_value=contestants,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_id",
-        side_effect=get_contestant_by_id,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",
-        side_effect=update_contestant,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_bibs",
+        return_value=None,
     )
 
     headers = {
@@ -377,15 +353,7 @@ async def test_assign_bibs_to_contestants_unknow_ageclass(
         return_value=contestants,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_id",
-        side_effect=get_contestant_by_id,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",
-        side_effect=update_contestant,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_bib",
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_bibs",
         return_value=None,
     )
 
@@ -2,12 +2,14 @@
 from copy import deepcopy
 from datetime import date
 import os
-from typing import Dict
+from typing import Any, Dict, List
 
 from aiohttp import hdrs
 from aiohttp.test_utils import TestClient as _TestClient
 from aioresponses import aioresponses
 import jwt
+import pandas as pd
+from pymongo.errors import BulkWriteError
 import pytest
 from pytest_mock import MockFixture
 
@@ -73,6 +75,13 @@ async def contestant() -> dict:
     }
 
 
+async def _upsert_all_as_created(
+    db: Any, event_id: str, contestants: List[dict], filters: List[dict]
+) -> dict:
+    """Mock an upsert where every contestant is created."""
+    return {i: f"_id_{i}" for i in range(len(contestants))}
+
+
 @pytest.fixture
 def token_unsufficient_role() -> str:
     """Create a valid token."""
@@ -157,16 +166,8 @@ async def test_create_contestants_csv_good_case(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     files = {"file": open("tests/files/contestants_G11.csv", "rb")}
@@ -196,14 +197,14 @@ async def test_create_contestants_csv_good_case(
 
 
 @pytest.mark.integration
-async def test_create_contestants_csv_iSonen_good_case(
+async def test_create_contestants_csv_with_duplicates_good_case(
     client: _TestClient,
     mocker: MockFixture,
     token: MockFixture,
     event: dict,
     new_contestant: dict,
 ) -> None:
-    """Should return 200 OK and simple result report in body."""
+    """Should return 200 OK and report repeated rows as updated."""
     EVENT_ID = "event_id_1"
     CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
@@ -214,17 +215,58 @@ async def test_create_contestants_csv_iSonen_good_case(
         "event_service.services.contestants_service.create_id",
         return_value=CONTESTANT_ID,
     )
+    upsert_contestants = mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
+    )
+
+    files = {"file": open("tests/files/contestants_G11_with_duplicates.csv", "rb")}
+
+    headers = {
+        hdrs.AUTHORIZATION: f"Bearer {token}",
+    }
+
+    with aioresponses(passthrough=["http://127.0.0.1"]) as m:
+        m.post("http://example.com:8081/authorize", status=204)
+        resp = await client.post(
+            f"/events/{EVENT_ID}/contestants", headers=headers, data=files
+        )
+        assert resp.status == 200
+
+        body = await resp.json()
+        assert type(body) is dict
+
+        assert body["total"] == 5
+        assert body["created"] == 3
+        assert len(body["updated"]) == 2
+        assert len(body["failures"]) == 0
+        # All distinct contestants are upserted in one batch:
+        upsert_contestants.assert_called_once()
+        assert len(upsert_contestants.call_args.args[2]) == 3
+
+
+@pytest.mark.integration
+async def test_create_contestants_csv_iSonen_good_case(
+    client: _TestClient,
+    mocker: MockFixture,
+    token: MockFixture,
+    event: dict,
+    new_contestant: dict,
+) -> None:
+    """Should return 200 OK and simple result report in body."""
+    EVENT_ID = "event_id_1"
+    CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
+        "event_service.adapters.events_adapter.EventsAdapter.get_event_by_id",  # noqa: B950
+        return_value=event,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
+        "event_service.services.contestants_service.create_id",
+        return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     files = {"file": open("tests/files/contestants_iSonen.csv", "rb")}
@@ -273,16 +315,8 @@ async def test_create_contestants_csv_Sportsadmin_good_case(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     files = {"file": open("tests/files/contestants_Sportsadmin.csv", "rb")}
@@ -331,16 +365,8 @@ async def test_create_contestants_csv_unsupported_format(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     files = {"file": open("tests/files/contestants_unsupported_format.csv", "rb")}
@@ -377,20 +403,8 @@ async def test_create_contestants_csv_no_minidrett_id_existing_good_case(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        return_value={},
     )
 
     files = {"file": open("tests/files/contestants_G11_no_minidrett_id.csv", "rb")}
@@ -439,16 +453,8 @@ async def test_create_contestants_csv_minidrett_id_existing_good_case(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        return_value={},
     )
 
     files = {"file": open("tests/files/contestants_G11.csv", "rb")}
@@ -496,16 +502,8 @@ async def test_create_contestants_csv_invalid_registration_date_good_case(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        return_value={},
     )
 
     files = {
@@ -538,14 +536,14 @@ async def test_create_contestants_csv_invalid_registration_date_good_case(
 
 
 @pytest.mark.integration
-async def test_create_contestants_csv_create_failures_good_case(
+async def test_create_contestants_csv_write_failure_good_case(
     client: _TestClient,
     mocker: MockFixture,
     token: MockFixture,
     event: dict,
     new_contestant: dict,
 ) -> None:
-    """Should return 200 OK and simple result report in body."""
+    """Should return 200 OK and report the row that failed to be written."""
     EVENT_ID = "event_id_1"
     CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
@@ -556,24 +554,81 @@ async def test_create_contestants_csv_create_failures_good_case(
         "event_service.services.contestants_service.create_id",
         return_value=CONTESTANT_ID,
     )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=None,
+    # The ordered bulk write creates the first row, fails on the second and stops,
+    # so the third row is sent in a new bulk write, where it is updated:
+    bulk_write_error = BulkWriteError(
+        {
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000"}],
+            "upserted": [{"index": 0, "_id": "_id_0"}],
+        }
     )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
+    upsert_contestants = mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=[bulk_write_error, {}],
     )
+
+    files = {"file": open("tests/files/contestants_G11.csv", "rb")}
+
+    headers = {
+        hdrs.AUTHORIZATION: f"Bearer {token}",
+    }
+
+    with aioresponses(passthrough=["http://127.0.0.1"]) as m:
+        m.post("http://example.com:8081/authorize", status=204)
+        resp = await client.post(
+            f"/events/{EVENT_ID}/contestants", headers=headers, data=files
+        )
+        assert resp.status == 200
+
+        body = await resp.json()
+        assert type(body) is dict
+
+        assert body["total"] == 3
+        assert body["created"] == 1
+        assert len(body["updated"]) == 1
+        assert len(body["failures"]) == 1
+        assert "E11000" in body["failures"][0]
+        # The updated contestant keeps the id it is stored with:
+        assert CONTESTANT_ID not in body["updated"][0]
+        assert upsert_contestants.call_count == 2
+        assert len(upsert_contestants.call_args.args[2]) == 1
+
+
+@pytest.mark.integration
+async def test_create_contestants_csv_write_concern_failure_good_case(
+    client: _TestClient,
+    mocker: MockFixture,
+    token: MockFixture,
+    event: dict,
+    new_contestant: dict,
+) -> None:
+    """Should return 200 OK and report every row when the write concern fails."""
+    EVENT_ID = "event_id_1"
+    CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.events_adapter.EventsAdapter.get_event_by_id",  # noqa: B950
+        return_value=event,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",  # noqa: B950
-        return_value=None,
+        "event_service.services.contestants_service.create_id",
+        return_value=CONTESTANT_ID,
+    )
+    # No single row failed, so there is no write error to stop at:
+    bulk_write_error = BulkWriteError(
+        {
+            "writeErrors": [],
+            "writeConcernErrors": [
+                {"code": 64, "errmsg": "waiting for replication timed out"}
+            ],
+            "upserted": [{"index": 0, "_id": "_id_0"}],
+        }
+    )
+    upsert_contestants = mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=bulk_write_error,
     )
 
-    files = {"file": open("tests/files/contestants_G11_with_failures.csv", "rb")}
+    files = {"file": open("tests/files/contestants_G11.csv", "rb")}
 
     headers = {
         hdrs.AUTHORIZATION: f"Bearer {token}",
@@ -587,27 +642,25 @@ async def test_create_contestants_csv_create_failures_good_case(
         assert resp.status == 200
 
         body = await resp.json()
-        print(f"body: {body}")
         assert type(body) is dict
 
-        assert body["total"] > 0
+        assert body["total"] == 3
         assert body["created"] == 0
         assert len(body["updated"]) == 0
         assert len(body["failures"]) == 3
-        assert body["total"] == body["created"] + len(body["updated"]) + len(
-            body["failures"]
-        )
+        assert "waiting for replication timed out" in body["failures"][0]
+        assert upsert_contestants.call_count == 1
 
 
 @pytest.mark.integration
-async def test_create_contestants_csv_update_failures_good_case(
+async def test_create_contestants_csv_repeated_row_write_failure_good_case(
     client: _TestClient,
     mocker: MockFixture,
     token: MockFixture,
     event: dict,
     new_contestant: dict,
 ) -> None:
-    """Should return 200 OK and simple result report in body."""
+    """Should return 200 OK and report a repeated row as failed with its write."""
     EVENT_ID = "event_id_1"
     CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
@@ -615,24 +668,75 @@ async def test_create_contestants_csv_update_failures_good_case(
         return_value=event,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
+        "event_service.services.contestants_service.create_id",
+        return_value=CONTESTANT_ID,
     )
+    rows = [
+        {**new_contestant, "minidrett_id": "1", "bib": None},
+        {**new_contestant, "minidrett_id": "1", "bib": None},
+    ]
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
+        "event_service.services.contestants_service.parse_contestants",
+        return_value=pd.DataFrame(
+            [{**row, "registration_date_time": "31.08.2021 12:00:00"} for row in rows]
+        ),
+    )
+    bulk_write_error = BulkWriteError(
+        {
+            "writeErrors": [{"index": 0, "code": 11000, "errmsg": "E11000"}],
+            "upserted": [],
+        }
     )
     mocker.patch(
-        "event_service.services.contestants_service.create_id",
-        return_value=CONTESTANT_ID,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=bulk_write_error,
     )
+
+    files = {"file": open("tests/files/contestants_G11.csv", "rb")}
+
+    headers = {
+        hdrs.AUTHORIZATION: f"Bearer {token}",
+    }
+
+    with aioresponses(passthrough=["http://127.0.0.1"]) as m:
+        m.post("http://example.com:8081/authorize", status=204)
+        resp = await client.post(
+            f"/events/{EVENT_ID}/contestants", headers=headers, data=files
+        )
+        assert resp.status == 200
+
+        body = await resp.json()
+        assert type(body) is dict
+
+        # Both rows share the one document that failed, so neither is updated:
+        assert body["total"] == 2
+        assert body["created"] == 0
+        assert len(body["updated"]) == 0
+        assert len(body["failures"]) == 2
+
+
+@pytest.mark.integration
+async def test_create_contestants_csv_validation_failures_good_case(
+    client: _TestClient,
+    mocker: MockFixture,
+    token: MockFixture,
+    event: dict,
+    new_contestant: dict,
+) -> None:
+    """Should return 200 OK and account for every row in the report."""
+    EVENT_ID = "event_id_1"
+    CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.events_adapter.EventsAdapter.get_event_by_id",  # noqa: B950
+        return_value=event,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.update_contestant",  # noqa: B950
-        return_value=None,
+        "event_service.services.contestants_service.create_id",
+        return_value=CONTESTANT_ID,
+    )
+    mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     files = {"file": open("tests/files/contestants_G11_with_failures.csv", "rb")}
@@ -640,6 +744,7 @@ async def test_create_contestants_csv_update_failures_good_case(
     headers = {
         hdrs.AUTHORIZATION: f"Bearer {token}",
     }
+
     with aioresponses(passthrough=["http://127.0.0.1"]) as m:
         m.post("http://example.com:8081/authorize", status=204)
         resp = await client.post(
@@ -648,12 +753,9 @@ async def test_create_contestants_csv_update_failures_good_case(
         assert resp.status == 200
 
         body = await resp.json()
-        print(f"body: {body}")
         assert type(body) is dict
 
-        assert body["total"] > 0
-        assert body["created"] == 0
-        assert len(body["updated"]) == 0
+        assert body["total"] == 3
         assert len(body["failures"]) > 0
         assert body["total"] == body["created"] + len(body["updated"]) + len(
             body["failures"]
@@ -661,14 +763,14 @@ async def test_create_contestants_csv_update_failures_good_case(
 
 
 @pytest.mark.integration
-async def test_create_contestants_csv_bad_case(
+async def test_create_contestants_csv_duplicate_bib_good_case(
     client: _TestClient,
     mocker: MockFixture,
     token: MockFixture,
     event: dict,
     new_contestant: dict,
 ) -> None:
-    """Should return 400 Bad request."""
+    """Should return 200 OK and report the second row with the same bib as failure."""
     EVENT_ID = "event_id_1"
     CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
@@ -676,19 +778,77 @@ async def test_create_contestants_csv_bad_case(
         return_value=event,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
+        "event_service.services.contestants_service.create_id",
+        return_value=CONTESTANT_ID,
     )
+    rows = [
+        {**new_contestant, "minidrett_id": "1", "bib": 1},
+        {**new_contestant, "minidrett_id": "1", "bib": 2},
+        {**new_contestant, "minidrett_id": "2", "bib": 1},
+        {**new_contestant, "minidrett_id": "3", "bib": 2},
+    ]
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
+        "event_service.services.contestants_service.parse_contestants",
+        return_value=pd.DataFrame(
+            [{**row, "registration_date_time": "31.08.2021 12:00:00"} for row in rows]
+        ),
     )
     mocker.patch(
-        "event_service.services.contestants_service.create_id",
-        return_value=CONTESTANT_ID,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_bib",  # noqa: B950
+        return_value=None,
+    )
+    upsert_contestants = mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
+
+    files = {"file": open("tests/files/contestants_G11.csv", "rb")}
+
+    headers = {
+        hdrs.AUTHORIZATION: f"Bearer {token}",
+    }
+
+    with aioresponses(passthrough=["http://127.0.0.1"]) as m:
+        m.post("http://example.com:8081/authorize", status=204)
+        resp = await client.post(
+            f"/events/{EVENT_ID}/contestants", headers=headers, data=files
+        )
+        assert resp.status == 200
+
+        body = await resp.json()
+        assert type(body) is dict
+
+        # The repeated first contestant gives bib 1 free for the third row,
+        # while the fourth row wants bib 2 that the first contestant now has:
+        assert body["total"] == 4
+        assert body["created"] == 2
+        assert len(body["updated"]) == 1
+        assert len(body["failures"]) == 1
+        assert "Bib 2" in body["failures"][0]
+        assert len(upsert_contestants.call_args.args[2]) == 2
+
+
+@pytest.mark.integration
+async def test_create_contestants_csv_bad_case(
+    client: _TestClient,
+    mocker: MockFixture,
+    token: MockFixture,
+    event: dict,
+    new_contestant: dict,
+) -> None:
+    """Should return 400 Bad request."""
+    EVENT_ID = "event_id_1"
+    CONTESTANT_ID = "290e70d5-0933-4af0-bb53-1d705ba7eb95"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
+        "event_service.adapters.events_adapter.EventsAdapter.get_event_by_id",  # noqa: B950
+        return_value=event,
+    )
+    mocker.patch(
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
+    )
+    mocker.patch(
+        "event_service.services.contestants_service.create_id",
         return_value=CONTESTANT_ID,
     )
 
@@ -721,21 +881,13 @@ async def test_create_contestants_csv_not_supported_content_type(
         return_value=event,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value={"id": CONTESTANT_ID},
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
     mocker.patch(
         "event_service.services.contestants_service.create_id",
         return_value=CONTESTANT_ID,
     )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
 
     files = {"file": open("tests/files/contestants_G11.csv", "rb")}
 
@@ -772,16 +924,8 @@ async def test_create_contestants_csv_good_case_octet_stream(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     with open("tests/files/contestants_G11.csv", "rb") as f:
@@ -948,7 +1092,7 @@ async def test_get_all_contestants_by_raceclass(
     """Should return OK and a valid json body."""
     EVENT_ID = "event_id_1"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_all_contestants",  # noqa: B950
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestants_by_ageclasses",  # noqa: B950
         return_value=[contestant],
     )
     mocker.patch(
@@ -976,7 +1120,7 @@ async def test_get_all_contestants_by_ageclass(
     """Should return OK and a valid json body."""
     EVENT_ID = "event_id_1"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_all_contestants",  # noqa: B950
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestants_by_ageclasses",  # noqa: B950
         return_value=[contestant],
     )
 
@@ -1172,16 +1316,8 @@ async def test_create_contestants_csv_event_not_found(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     files = {"file": open("tests/files/contestants_G11.csv", "rb")}
@@ -1217,16 +1353,8 @@ async def test_create_contestants_csv_octet_stream_event_not_found(
         return_value=CONTESTANT_ID,
     )
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.create_contestant",  # noqa: B950
-        return_value=CONTESTANT_ID,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_name",  # noqa: B950
-        return_value=None,
-    )
-    mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestant_by_minidrett_id",  # noqa: B950
-        return_value=None,
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.upsert_contestants",  # noqa: B950
+        side_effect=_upsert_all_as_created,
     )
 
     with open("tests/files/contestants_G11.csv", "rb") as f:
@@ -1412,7 +1540,7 @@ async def test_get_all_contestants_by_raceclass_raceclass_does_not_exist(
     """Should return 400 Bad request."""
     EVENT_ID = "event_id_1"
     mocker.patch(
-        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_all_contestants",  # noqa: B950
+        "event_service.adapters.contestants_adapter.ContestantsAdapter.get_contestants_by_ageclasses",  # noqa: B950
         return_value=[contestant],
     )
     mocker.patch(